@@ -161,8 +161,7 @@ class CalendarCog(commands.Cog):
         interaction: :class:`Interaction`
             The interaction that triggered the command.
         """
-        msg = await interaction.original_message()
-        await msg.edit(file=self._ctrl.embed_json)
+        await interaction.edit_original_message(file=self._ctrl.embed_json)
 
     @_calendar.subcommand(
         name="set_json",
@@ -446,8 +445,9 @@ class CalendarCog(commands.Cog):
         # We edit the original message here
         # instead of in the `with_info` decorator,
         # because we don't have access to the event description there.
-        msg = await interaction.original_message()
-        await msg.edit(f"The event '{event.full_info}' has been removed.")
+        await interaction.edit_original_message(
+            content=f"The event '{event.full_info}' has been removed."
+        )
 
     @_calendar.subcommand(
         name="remove_expired_events",
@@ -1075,11 +1075,15 @@ class CalendarModel(Model):
         Raises
         ------
         IndexError
+            - If the index is not a number.
             - If the index is out of bounds (less than 1 or greater than the number of events).
             - If there are no events.
         """
         is_hidden = index.startswith("_")
-        idx = int(index[1:] if is_hidden else index)
+        try:
+            idx = int(index[1:] if is_hidden else index)
+        except ValueError as e:
+            raise IndexError(f"The index '{index}' is not a number") from e
         return self.get_event_at_index(idx, is_hidden=is_hidden)
 
     def get_event_at_index(self, index: int, *, is_hidden: bool = False) -> Event:
@@ -1179,10 +1183,7 @@ class CalendarModel(Model):
             if event.is_hidden:
                 continue
 
-            try:
-                calendar[event.date].append(event)
-            except KeyError:
-                calendar[event.date] = [event]
+            calendar.setdefault(event.date, []).append(event)
 
         for date, event in calendar.items():
             yield (date, event)
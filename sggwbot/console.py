@@ -122,6 +122,7 @@ class Console:
         bold_text: bool,
         bold_type: bool,
         exception: Exception | str | None = None,
+        formatted_traceback: str | None = None,
     ) -> None:
         date = dt.datetime.now().strftime("%d.%m.%y %H:%M:%S")
         reset = "\033[0m"
@@ -130,7 +131,7 @@ class Console:
         _bold_type = "\033[1m" if bold_type else ""
 
         if isinstance(exception, Exception):
-            exc = "\n" + traceback.format_exc()
+            exc = "\n" + (formatted_traceback or traceback.format_exc())
         elif isinstance(exception, str):
             exc = "| " + exception
         else:
@@ -198,6 +199,7 @@ class Console:
         """
 
         color = FontColour.YELLOW
+        formatted_traceback = traceback.format_exc() if exception else None
         cls._logs.append(f'\n{" WARNING ":-^35}')
         cls._print_to_console(
             text,
@@ -206,9 +208,10 @@ class Console:
             bold_text=bold_text,
             bold_type=bold_type,
             exception=exception,
+            formatted_traceback=formatted_traceback,
         )
-        if exception:
-            cls._logs.append(traceback.format_exc())
+        if formatted_traceback:
+            cls._logs.append(formatted_traceback)
         cls._logs.append("-" * 37 + "\n")
         cls._append_to_file()
 
@@ -226,6 +229,7 @@ class Console:
         If an exception is given, it also prints the traceback.
         """
         color = FontColour.RED
+        formatted_traceback = traceback.format_exc() if exception else None
         cls._logs.append(f'\n{" ERROR ":-^38}')
         cls._print_to_console(
             text,
@@ -234,9 +238,10 @@ class Console:
             bold_text=bold_text,
             bold_type=bold_type,
             exception=exception,
+            formatted_traceback=formatted_traceback,
         )
-        if exception:
-            cls._logs.append(traceback.format_exc())
+        if formatted_traceback:
+            cls._logs.append(formatted_traceback)
         cls._logs.append("-" * 41 + "\n")
         cls._append_to_file()
 
@@ -251,6 +256,7 @@ class Console:
     ) -> None:
         """Prints an error with traceback in red to the console."""
         color = FontColour.RED
+        formatted_traceback = traceback.format_exc()
         cls._logs.append(f'\n{" IMPORTANT ERROR ":-^33}')
         cls._print_to_console(
             text,
@@ -259,8 +265,9 @@ class Console:
             bold_text=bold_text,
             bold_type=bold_type,
             exception=exception,
+            formatted_traceback=formatted_traceback,
         )
-        cls._logs.append(traceback.format_exc())
+        cls._logs.append(formatted_traceback)
         cls._logs.append("-" * 41 + "\n")
         cls._append_to_file()
 
@@ -270,6 +277,7 @@ class Console:
 
         If an exception is given, it also prints the traceback.
         """
+        formatted_traceback = traceback.format_exc() if exception else None
         cls._logs.append(f'\n{" CRITICAL ERROR ":=^33}')
         cls._print_to_console(
             text,
@@ -278,10 +286,11 @@ class Console:
             bold_text=True,
             bold_type=True,
             exception=exception,
+            formatted_traceback=formatted_traceback,
         )
         cls._logs.append(f"{exception}\n")
-        if exception:
-            cls._logs.append(traceback.format_exc())
+        if formatted_traceback:
+            cls._logs.append(formatted_traceback)
         cls._append_to_file()
         sys.exit()
 
@@ -120,8 +120,9 @@ class InformationCog(commands.Cog):
         interaction: :class:`Interaction`
             The interaction that triggered the command.
         """
-        msg = await interaction.original_message()
-        await msg.edit(content=None, file=self._ctrl.embed_json)
+        await interaction.edit_original_message(
+            content=None, file=self._ctrl.embed_json
+        )
 
     @_information.subcommand(
         name="set_json",
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import io
 import json
+import re
 from typing import TYPE_CHECKING, Any, Optional
 
 import nextcord
@@ -15,6 +16,7 @@ from nextcord.errors import DiscordException
 from nextcord.ext import commands
 from nextcord.file import File
 from nextcord.interactions import Interaction
+from nextcord.mentions import AllowedMentions
 from nextcord.message import Attachment, MessageReference
 from nextcord.threads import Thread
 
@@ -25,6 +27,9 @@ from sggwbot.utils import InteractionUtils, MemberUtils
 if TYPE_CHECKING:
     from sggw_bot import SGGWBot
 
+_ESCAPE_SEQUENCE = re.compile(r"\\([nt])")
+_ESCAPED_CHARS = {"n": "\n", "t": "\t"}
+
 
 class MessagingCog(commands.Cog):
     """A cog to control bot messages."""
@@ -36,6 +41,32 @@ class MessagingCog(commands.Cog):
     def __init__(self, bot: SGGWBot) -> None:
         self._bot = bot
 
+    @staticmethod
+    def _unescape(text: str) -> str:
+        """Replaces the escaped ``\\n`` and ``\\t`` sequences with the characters."""
+        return _ESCAPE_SEQUENCE.sub(lambda m: _ESCAPED_CHARS[m.group(1)], text)
+
+    @staticmethod
+    def _parse_message_id(message_id: str) -> int:
+        try:
+            return int(message_id)
+        except ValueError as e:
+            raise ValueError("The message ID must be numeric") from e
+
+    async def _get_message(
+        self, channel: TextChannel | Thread, message_id: str
+    ) -> nextcord.Message:
+        """Returns the message from the bot's message cache or fetches it.
+
+        The cache is kept up to date by gateway events,
+        so the message is only fetched if the bot has not seen it yet.
+        """
+        msg_id = self._parse_message_id(message_id)
+        message = nextcord.utils.get(self._bot.cached_messages, id=msg_id)
+        if message is None or message.channel.id != channel.id:
+            message = await channel.fetch_message(msg_id)
+        return message
+
     @staticmethod
     async def _convert_attachment_to_file(attachment: Attachment) -> File:
         return File(io.BytesIO(await attachment.read()), filename=attachment.filename)
@@ -44,7 +75,10 @@ class MessagingCog(commands.Cog):
     async def _convert_attachment_to_embed(attachment: Attachment) -> Embed:
         if not attachment.filename.endswith(".json"):
             raise AttachmentError("The attachment must be a JSON file")
-        return Embed.from_dict(json.loads(io.BytesIO(await attachment.read()).read()))
+        data = json.loads(await attachment.read())
+        if not isinstance(data, dict):
+            raise AttachmentError("The attachment must contain a JSON object")
+        return Embed.from_dict(data)
 
     @commands.Cog.listener(name="on_message")
     async def _on_message(self, message: nextcord.Message) -> None:
@@ -114,9 +148,7 @@ class MessagingCog(commands.Cog):
             default=False,
         ),
     ) -> None:
-        message_kwargs: dict[str, Any] = {
-            "content": text.replace("\\n", "\n").replace("\\t", "\t")
-        }
+        message_kwargs: dict[str, Any] = {"content": self._unescape(text)}
 
         if reply_to_msg_id and preview:
             raise ValueError("Cannot preview a reply")
@@ -128,8 +160,9 @@ class MessagingCog(commands.Cog):
         if reply_to_msg_id:
             message_kwargs["reference"] = MessageReference(
                 channel_id=channel.id,
-                message_id=int(reply_to_msg_id),
+                message_id=self._parse_message_id(reply_to_msg_id),
             )
+            message_kwargs["allowed_mentions"] = AllowedMentions(replied_user=False)
 
         if embed:
             message_kwargs["embed"] = await self._convert_attachment_to_embed(embed)
@@ -184,10 +217,10 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot edit messages in non-text channels")
 
-        message = await channel.fetch_message(int(message_id))
+        message = await self._get_message(channel, message_id)
 
         if text:
-            message_kwargs["content"] = text.replace("\\n", "\n").replace("\\t", "\t")
+            message_kwargs["content"] = self._unescape(text)
 
         if embed:
             message_kwargs["embed"] = await self._convert_attachment_to_embed(embed)
@@ -227,7 +260,7 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot delete messages in non-text channels")
 
-        message = await channel.fetch_message(int(message_id))
+        message = await self._get_message(channel, message_id)
 
         if message.author != self._bot.user:
             raise PermissionError("Cannot delete messages not sent by the bot")
@@ -274,7 +307,7 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot edit messages in non-text channels")
 
-        message = await channel.fetch_message(int(message_id))
+        message = await self._get_message(channel, message_id)
         message_kwargs: dict[str, Any] = {}
 
         if text:
@@ -314,13 +347,14 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot send messages to non-text channels")
 
-        original_message = await channel.fetch_message(int(message_id))
-        message_attachments = original_message.attachments
+        original_message = await self._get_message(channel, message_id)
 
-        new_attachments = message_attachments + [attachment]
-        files = [await self._convert_attachment_to_file(a) for a in new_attachments]
-
-        await original_message.edit(files=files)
+        # The existing attachments are kept by their IDs,
+        # so only the new file has to be uploaded.
+        await original_message.edit(
+            attachments=original_message.attachments,
+            file=await self._convert_attachment_to_file(attachment),
+        )
 
     @_message.subcommand(
         name="add_reaction",
@@ -348,7 +382,7 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot edit messages in non-text channels")
 
-        message = await channel.fetch_message(int(message_id))
+        message = await self._get_message(channel, message_id)
 
         await message.add_reaction(emoji)
 
@@ -378,7 +412,7 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot edit messages in non-text channels")
 
-        message = await channel.fetch_message(int(message_id))
+        message = await self._get_message(channel, message_id)
 
         emojis_to_add = emojis.split(" ")
         unadded_emojis: dict[str, nextcord.DiscordException] = {}
@@ -419,7 +453,7 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot edit messages in non-text channels")
 
-        message = await channel.fetch_message(int(message_id))
+        message = await self._get_message(channel, message_id)
 
         await message.remove_reaction(emoji, self._bot.user)  # type: ignore
 
@@ -444,7 +478,7 @@ class MessagingCog(commands.Cog):
         if not isinstance(channel, (TextChannel, Thread)):
             raise ValueError("Cannot edit messages in non-text channels")
 
-        message = await channel.fetch_message(int(message_id))
+        message = await self._get_message(channel, message_id)
 
         if not message.embeds:
             raise ValueError("The message does not contain an embed.")
@@ -452,10 +486,11 @@ class MessagingCog(commands.Cog):
         embed = message.embeds[0]
         embed_json = embed.to_dict()
 
-        msg = await interaction.original_message()
-        await msg.edit(
+        await interaction.edit_original_message(
             file=nextcord.File(
-                io.BytesIO(json.dumps(embed_json, indent=4).encode("utf-8")),
+                io.BytesIO(
+                    json.dumps(embed_json, ensure_ascii=False, indent=4).encode("utf-8")
+                ),
                 filename="embed.json",
             )
         )
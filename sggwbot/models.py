@@ -21,8 +21,9 @@ Examples
 
 from __future__ import annotations
 
-import io
+import asyncio
 import json
+import os
 from abc import ABC
 from dataclasses import dataclass
 from datetime import datetime
@@ -36,14 +37,18 @@ from nextcord.errors import DiscordException
 
 from .console import Console
 from .errors import UpdateEmbedError
-from .utils import PathUtils
+from .utils import FileCache, PathUtils
 
 if TYPE_CHECKING:
     from nextcord.emoji import Emoji
-    from nextcord.message import Attachment, Message
+    from nextcord.message import Attachment, Message, PartialMessage
 
     from .sggw_bot import SGGWBot
 
+# Parsed settings files and raw embed templates.
+_SETTINGS_CACHE = FileCache[dict[str, Any]](lambda path: json.loads(path.read_bytes()))
+_EMBED_TEMPLATE_CACHE = FileCache[str](lambda path: path.read_text(encoding="utf-8"))
+
 
 class Model(ABC):
     """Base class for Model classes.
@@ -88,8 +93,7 @@ class Model(ABC):
         return path
 
     def _load_settings(self) -> None:
-        with open(self._settings_path, "r", encoding="utf-8") as f:
-            self._data = json.load(f)
+        self._data = _SETTINGS_CACHE.get(self._settings_path)
 
     @property
     def data(self) -> dict[str, Any]:
@@ -107,9 +111,12 @@ class Model(ABC):
             Cannot open the json file.
         JSONDecodeError
             Json file is corrupted.
+
+        Notes
+        -----
+        The file is parsed again only if it has changed since the last read.
         """
-        with open(self._settings_path, "r", encoding="utf-8") as f:
-            self._data = json.load(f)
+        self._load_settings()
 
     def update_settings(self, key: str, value: Any, *, force: bool = False) -> None:
         """Updates the :attr:`.data` dictionary and the `settings.json` file.
@@ -135,8 +142,16 @@ class Model(ABC):
             raise KeyError(f"Invalid key ({key}) when updating {self._settings_path}.")
 
         self._data[key] = value
-        with open(self._settings_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, ensure_ascii=True, indent=4, default=str)
+        path = self._settings_path
+
+        # Write to a temporary file first, so that a crash during writing
+        # does not leave a truncated settings file behind.
+        content = json.dumps(self._data, ensure_ascii=True, indent=4, default=str)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        _SETTINGS_CACHE.set(path, self._data)
 
 
 @dataclass(slots=True)
@@ -236,8 +251,7 @@ class EmbedModel(ABC):
             and values represent substitutions.
         """
 
-        with open(self.embed_path, "r", encoding="utf-8") as f:
-            raw_data: str = f.read()
+        raw_data = self._read_embed_template()
 
         current_time = datetime.now().strftime("%d.%m.%Y %H:%M")
         raw_data = raw_data.replace(r"{CURRENT_TIME}", current_time)
@@ -248,6 +262,9 @@ class EmbedModel(ABC):
         data: dict = json.loads(raw_data)
         return Embed.from_dict(data)
 
+    def _read_embed_template(self) -> str:
+        return _EMBED_TEMPLATE_CACHE.get(self.embed_path)
+
 
 class ControllerWithEmbed(Controller, ABC):
     """Class for Controller classes which also control an embed.
@@ -284,6 +301,23 @@ class ControllerWithEmbed(Controller, ABC):
         for reaction in self.embed_model.reactions:
             await message.add_reaction(reaction)
 
+    async def _reload_reactions_on_message(self, message: Message) -> None:
+        # Discord keeps reactions in the order they were added,
+        # so only missing trailing reactions can be added in place.
+        # Otherwise, all reactions are cleared and added again.
+        expected = [str(reaction) for reaction in self.embed_model.reactions]
+        current = [str(reaction.emoji) for reaction in message.reactions if reaction.me]
+
+        if current == expected:
+            return
+
+        if current != expected[: len(current)]:
+            await message.clear_reactions()
+            current = []
+
+        for reaction in self.embed_model.reactions[len(current) :]:
+            await message.add_reaction(reaction)
+
     async def send_embed(self, channel: TextChannel) -> Message:
         """|coro|
 
@@ -304,6 +338,8 @@ class ControllerWithEmbed(Controller, ABC):
 
         embed = self.embed_model.generate_embed()
         message = await channel.send(embed=embed)
+        # Saved on the event loop, as the settings dict is shared
+        # through the cache and may be modified by other coroutines.
         self._save_message_data_in_settings(message)
         await self._add_reactions_to_message(message)
         return message
@@ -318,7 +354,8 @@ class ControllerWithEmbed(Controller, ABC):
         Parameters
         ----------
         reload_reactions: :class:`bool`
-            Whether to clear reactions and add them again.
+            Whether to bring the reactions in line with the embed model.
+            Reactions that are already up to date are left untouched.
 
         Raises
         ------
@@ -333,12 +370,12 @@ class ControllerWithEmbed(Controller, ABC):
 
         try:
             self.model.reload_settings()
-            message = await self._get_message_from_settings()
+            partial_message = self._get_message_from_settings()
             embed = self.embed_model.generate_embed()
-            message = await message.edit(embed=embed)
+            # Editing returns the full message, so there is no need to fetch it.
+            message: Message = await partial_message.edit(embed=embed)  # type: ignore
             if reload_reactions:
-                await message.clear_reactions()
-                await self._add_reactions_to_message(message)
+                await self._reload_reactions_on_message(message)
         except (DiscordException, TypeError) as e:
             raise UpdateEmbedError(*e.args) from e
         return message
@@ -368,28 +405,30 @@ class ControllerWithEmbed(Controller, ABC):
 
         if not file.filename.lower().endswith(".json"):
             raise TypeError("The attachment must have a `.json` extension")
+        content = await file.read()
         try:
-            json.loads(io.BytesIO(await file.read()).read().decode("utf-8"))
+            json.loads(content.decode("utf-8"))
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise TypeError("The attachment must be a valid JSON file") from e
-        await file.save(self.embed_model.embed_path)
+        path = self.embed_model.embed_path
+        await asyncio.to_thread(path.write_bytes, content)
+        _EMBED_TEMPLATE_CACHE.invalidate(path)
 
     def _save_message_data_in_settings(self, message: Message) -> None:
         data = {"channel_id": message.channel.id, "message_id": message.id}
         self.model.update_settings("embed_message", data, force=True)
 
-    async def _get_message_from_settings(self) -> Message:
-        """|coro|
-
-        Returns a message fetched from a text channel.
+    def _get_message_from_settings(self) -> PartialMessage:
+        """Returns a partial message in a text channel.
         Channel and message IDs will be retrived from :attr:`model.data`.
 
+        The message is not fetched, so the returned object
+        does not make any API calls until it is used.
+
         Raises
         ------
         TypeError
             Channel is not a :class:`TextChannel`.
-        ~nextcord.DiscordException
-            Message cannot be fetched.
         """
 
         data: dict[str, int] = self.model.data.get("embed_message", {})
@@ -400,5 +439,4 @@ class ControllerWithEmbed(Controller, ABC):
         if not isinstance(channel, TextChannel):
             raise TypeError("Channel must be TextChannel")
 
-        message = await channel.fetch_message(msg_id)
-        return message
+        return channel.get_partial_message(msg_id)
@@ -131,8 +131,7 @@ class ProjectCog(commands.Cog):
         interaction: :class:`Interaction`
             The interaction that triggered the command.
         """
-        msg = await interaction.original_message()
-        await msg.edit(file=self._ctrl.embed_json)
+        await interaction.edit_original_message(file=self._ctrl.embed_json)
 
     @_project.subcommand(
         name="set_json",
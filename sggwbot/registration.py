@@ -12,12 +12,13 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import functools
 import json
 import os
-import random
+import re
+import secrets
 import string
 from dataclasses import dataclass, field
-from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
@@ -38,7 +39,13 @@ from nextcord.ui import Modal, TextInput
 from sggwbot.console import Console, FontColour
 from sggwbot.errors import ExceptionData, RegistrationError
 from sggwbot.models import Model
-from sggwbot.utils import InteractionUtils, Matcher, MemberUtils, SmartDict
+from sggwbot.utils import (
+    FileCache,
+    InteractionUtils,
+    Matcher,
+    MemberUtils,
+    SmartDict,
+)
 
 if TYPE_CHECKING:
     from nextcord.guild import Guild
@@ -46,6 +53,114 @@ if TYPE_CHECKING:
     from nextcord.role import Role
     from sggw_bot import SGGWBot
 
+# Parsed registration files.
+# '_save_registered_users' refreshes the registered users entry.
+_REGISTERED_USERS = FileCache[dict[str, dict[str, Any]]](
+    lambda path: json.loads(path.read_bytes())
+)
+_STUDENT_INDEXES = FileCache[frozenset[str]](
+    lambda path: frozenset(path.read_text(encoding="utf-8").splitlines())
+)
+_MAIL_TEMPLATE = FileCache[str](lambda path: path.read_text(encoding="utf-8"))
+
+# Index numbers mapped to the IDs of registered members, keyed by path,
+# together with the registered users data they were built from.
+_MEMBER_IDS_BY_INDEX_CACHE: dict[
+    Path, tuple[dict[str, dict[str, Any]], dict[str, list[int]]]
+] = {}
+
+# The SMTP client reused between sent mails, so the TLS handshake
+# and the login are not repeated for every registration.
+_SMTP_CLIENT: aiosmtplib.SMTP | None = None
+_SMTP_LOCK = asyncio.Lock()
+
+_MAIL_SUBJECT = "Rejestracja Discord"
+_MAIL_SENDER = "noreply"
+
+# Matches placeholders like '{{REGISTRATION_CODE}}' in the mail template.
+_MAIL_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+# Files that are known to exist, so they are not checked on every access.
+_EXISTING_FILES: set[Path] = set()
+
+
+def _ensure_file_exists(path: Path, default_content: str) -> Path:
+    """Creates the file with the default content if it does not exist.
+
+    The check is made only once per path while the bot is running.
+    """
+    if path not in _EXISTING_FILES:
+        if not path.exists():
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(default_content)
+            Console.warn(f"File {path} has been created.")
+        _EXISTING_FILES.add(path)
+    return path
+
+
+def _get_member_ids_by_index(path: Path) -> dict[str, list[int]]:
+    """Returns the IDs of registered members grouped by their index numbers.
+
+    The mapping is built again only if the registered users data has changed.
+    """
+    data = _REGISTERED_USERS.get(path)
+
+    cached = _MEMBER_IDS_BY_INDEX_CACHE.get(path)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+
+    member_ids_by_index: dict[str, list[int]] = {}
+    for member_id, member_data in data.items():
+        if index := member_data.get("StudentID"):
+            member_ids_by_index.setdefault(index, []).append(int(member_id))
+    _MEMBER_IDS_BY_INDEX_CACHE[path] = (data, member_ids_by_index)
+    return member_ids_by_index
+
+
+@functools.cache
+def _get_mail_env_value(name: str) -> str:
+    """Returns the value of the environment variable used for sending mails.
+
+    The value is read once and then kept while the bot is running.
+
+    Raises
+    ------
+    RegistrationError
+        The environment variable is not set.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        raise RegistrationError(f"{name} in .env is empty")
+    return value
+
+
+def _save_registered_users(path: Path, data: dict[str, dict[str, Any]]) -> None:
+    """Saves the registered users file and refreshes its cache entry.
+
+    The data is written to a temporary file first, which then replaces
+    the original one, so the file is never left half-written.
+
+    If saving fails, the cache entry is dropped, as the cached data
+    may have been modified in place and would not match the file.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        content = json.dumps(data, ensure_ascii=True, indent=4)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        _REGISTERED_USERS.invalidate(path)
+        _MEMBER_IDS_BY_INDEX_CACHE.pop(path, None)
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _REGISTERED_USERS.set(path, data)
+    # The data may have been modified in place, so the mapping built
+    # from it is not up to date anymore.
+    _MEMBER_IDS_BY_INDEX_CACHE.pop(path, None)
+
 
 class RegistrationCog(commands.Cog):
     """A cog to control the registration process."""
@@ -53,22 +168,25 @@ class RegistrationCog(commands.Cog):
     __slots__ = (
         "_bot",
         "_model",
+        "_registration_channel_id",
     )
 
     _bot: SGGWBot
     _model: RegistrationModel
+    _registration_channel_id: int | None
 
     def __init__(self, bot: SGGWBot) -> None:
         """Initializes the :class:`.RegistractionCog` class."""
         self._bot = bot
         self._model = RegistrationModel(bot)
+        self._registration_channel_id = None
 
     @commands.Cog.listener("on_message")
     async def _on_message(self, message: Message) -> None:
         """Deletes message if it's not from the bot
         and is in the registration channel.
         """
-        if message.channel.id != self._model.registration_channel_id:
+        if message.channel.id != self._registration_channel_id:
             return
 
         if message.author == self._bot.user:
@@ -82,16 +200,16 @@ class RegistrationCog(commands.Cog):
     async def _clear_messages_on_channel(self) -> None:
         """Clears all messages on the registration channel, except the bot's messages."""
         channel = self._model.registration_channel
-        messages = await channel.history(limit=None).flatten()
-        to_delete: list[Message] = []
-        for message in messages:
-            if message.author != self._bot.user:
-                to_delete.append(message)
-
-        await asyncio.gather(*(msg.delete() for msg in to_delete))
+        await channel.purge(
+            limit=None,
+            check=lambda message: message.author != self._bot.user,
+            bulk=True,
+        )
 
     @commands.Cog.listener(name="on_ready")
     async def _on_ready(self) -> None:
+        # Stored once, as it is compared against every message the bot sees.
+        self._registration_channel_id = self._model.registration_channel_id
         await self._clear_messages_on_channel()
 
     @nextcord.slash_command(
@@ -138,7 +256,8 @@ class RegistrationCog(commands.Cog):
         RegistrationError
             If the registration failed.
         """
-        if not index.isdigit():
+        # `isdigit` alone also accepts non-ASCII digits, like '²' or '٣'.
+        if not (index.isascii() and index.isdigit()):
             await interaction.response.send_message(
                 "Numer indeksu musi zawierać 6 cyfr!",
                 ephemeral=True,
@@ -253,27 +372,21 @@ class RegistrationCog(commands.Cog):
             )
             return
 
-        # Reverse the list to show the most relevant members at the end.
-        matching_members = matching_members[::-1]
-
-        embeds = []
-        for member_data in matching_members:
-            embeds.append(member_data.to_embed())
+        # A message can contain up to 10 embeds, so only the most
+        # relevant members are converted. They are reversed to show
+        # the most relevant members at the end.
+        embeds = [member_data.to_embed() for member_data in matching_members[:10]]
+        embeds.reverse()
 
         message = (
-            f"Found **{len(embeds)}** member(s) matching the argument: **{argument}**"
+            f"Found **{len(matching_members)}** member(s) "
+            f"matching the argument: **{argument}**"
         )
 
-        if len(embeds) > 10:
-            await interaction.response.send_message(
-                message + "\n**Showing only 10.**",
-                embeds=embeds[:10],
-                ephemeral=True,
-            )
-        else:
-            await interaction.response.send_message(
-                message, embeds=embeds, ephemeral=True
-            )
+        if len(matching_members) > 10:
+            message += "\n**Showing only 10.**"
+
+        await interaction.response.send_message(message, embeds=embeds, ephemeral=True)
 
     @nextcord.slash_command(
         name="edit_member_data",
@@ -375,7 +488,7 @@ class RegistrationModel(Model):
     bot: SGGWBot
 
     def __init__(self, bot: SGGWBot) -> None:
-        Model.__init__(self)
+        super().__init__()
         self.bot = bot
 
     @property
@@ -413,23 +526,21 @@ class RegistrationModel(Model):
 
     @property
     def _registered_users_path(self) -> Path:
-        return Path("data/registration/registered_users.json")
+        return _ensure_file_exists(
+            Path("data/registration/registered_users.json"), r"{}"
+        )
 
     def get_member_data(self, member_id: str) -> dict[str, Any]:
-        """Returns the member data."""
-        path = self._registered_users_path
-        with open(path, "r", encoding="utf-8") as f:
-            data: dict[str, dict[str, Any]] = json.load(f)
-        return data.get(member_id, {})
+        """Returns a copy of the member data."""
+        data = _REGISTERED_USERS.get(self._registered_users_path)
+        return data.get(member_id, {}).copy()
 
     def set_member_data(self, member_id: str, member_data: dict[str, Any]) -> None:
         """Sets the member data."""
         path = self._registered_users_path
-        with open(path, "r", encoding="utf-8") as f:
-            data: dict[str, dict[str, Any]] = json.load(f)
+        data = _REGISTERED_USERS.get(path)
         data[member_id] = member_data
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        _save_registered_users(path, data)
 
     def find_matching_members(self, argument: str) -> list[MemberData]:
         """Finds the matching members.
@@ -455,8 +566,12 @@ class RegistrationModel(Model):
         """
         guild = self.bot.get_default_guild()
 
-        if len(argument) == 6 and argument.isdigit():
-            return self._find_members_by_index(argument, guild)
+        # `isdigit` alone also accepts non-ASCII digits, like '²' or '٣'.
+        if argument.isascii() and argument.isdigit():
+            if len(argument) == 6:
+                return self._find_members_by_index(argument, guild)
+            if member := guild.get_member(int(argument)):
+                return [MemberData(member)]
 
         argument = argument.lower()
         results = SmartDict[MemberData, float](lambda a, b: a > b)
@@ -474,24 +589,25 @@ class RegistrationModel(Model):
             lambda i: i.last_name + i.first_name,
         ]
 
+        # Only members whose ratio is greater than 0.5 and 90% of the best ratio
+        # are returned, so lower ratios than 0.45 never affect the result.
         for key in keys:
-            for i in matcher.match_all(argument, key=key):
+            for i in matcher.match_all(argument, key=key, min_ratio=0.45):
                 results[i.item] = i.ratio
 
-        if (max_ratio := max(results.values())) <= 0.5:
+        if not results or (max_ratio := max(results.values())) <= 0.5:
             return []
 
-        results = dict(sorted(results.items(), key=lambda i: i[1], reverse=True))
-
-        return [i[0] for i in results.items() if i[1] > max_ratio * 0.9]
+        # Only the matching members are sorted, not all the compared ones.
+        threshold = max_ratio * 0.9
+        matching = [i for i in results.items() if i[1] > threshold]
+        matching.sort(key=lambda i: i[1], reverse=True)
+        return [member_data for member_data, _ in matching]
 
     def _find_members_by_index(self, index: str, guild: Guild) -> list[MemberData]:
-        matching_members = []
-        for member in guild.members:
-            member_data = MemberData(member)
-            if member_data.index == index:
-                matching_members.append(member_data)
-        return matching_members
+        member_ids = _get_member_ids_by_index(self._registered_users_path)
+        members = (guild.get_member(i) for i in member_ids.get(index, []))
+        return [MemberData(member) for member in members if member is not None]
 
 
 @dataclass(slots=True)
@@ -509,6 +625,14 @@ class MailLog:
     provided_index: str
     mails_sent_time: list[dt.datetime] = field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MailLog:
+        """Creates the object from its dictionary representation."""
+        return cls(
+            data["provided_index"],
+            [dt.datetime.fromtimestamp(i) for i in data["mails_sent_time"]],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Returns a dictionary representation of the object."""
         return {
@@ -571,18 +695,11 @@ class CodeModel:
         The email should be sent if it's the first email for this index number
         or the previous email was sent more than 5 minutes ago.
         """
-        if index not in [log.provided_index for log in self.mail_logs]:
-            return True
-
         five_minutes_ago = dt.datetime.now() - dt.timedelta(minutes=5)
         for log in self.mail_logs:
             if log.provided_index == index:
-                for time in log.mails_sent_time:
-                    if time > five_minutes_ago:
-                        return False
-                return True
-
-        return True  # pragma: no cover
+                return all(time <= five_minutes_ago for time in log.mails_sent_time)
+        return True
 
     def check_if_blocked(self, index: str) -> str | None:
         """Checks if the registration should be blocked.
@@ -632,6 +749,15 @@ class CodeModel:
                 return
         self.mail_logs.append(MailLog(index, [dt_now]))
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CodeModel:
+        """Creates the object from its dictionary representation."""
+        return cls(
+            data["code"],
+            dt.datetime.fromtimestamp(data["generation_time"]),
+            [MailLog.from_dict(log) for log in data["mail_logs"]],
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Returns a dictionary representation of the object."""
         return {
@@ -687,39 +813,21 @@ class CodeController:
 
     @property
     def _codes_path(self) -> Path:
-        path = self._registration_path / "codes.json"
-        if not path.exists():
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(r"{}")
-            Console.warn(f"File {path} has been created.")
-        return path
+        return _ensure_file_exists(self._registration_path / "codes.json", r"{}")
 
-    @property
-    def _codes_data(self) -> dict[str, CodeModel]:
-        with open(self._codes_path, "r", encoding="utf-8") as f:
-            data: dict[str, dict[str, Any]] = json.load(f)
-
-        ret = {}
-        for k, v in data.items():
-            logs = []
-            for log in v["mail_logs"]:
-                mail_log = MailLog(
-                    log["provided_index"],
-                    [dt.datetime.fromtimestamp(i) for i in log["mails_sent_time"]],
-                )
-                logs.append(mail_log)
-            ret[k] = CodeModel(
-                v["code"], dt.datetime.fromtimestamp(v["generation_time"]), logs
-            )
-        return ret
+    @staticmethod
+    def _load_codes_data(path: Path) -> dict[str, dict[str, Any]]:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
 
     @staticmethod
     def _generate_code() -> str:
-        return "".join([random.choice(string.ascii_letters) for _ in range(8)])
+        return "".join(secrets.choice(string.ascii_letters) for _ in range(8))
 
     def __enter__(self) -> CodeController:
-        member_id = self.member.id
-        code_model = self._codes_data.get(str(member_id))
+        # Only the member's entry is converted to a model.
+        code_data = self._load_codes_data(self._codes_path).get(str(self.member.id))
+        code_model = CodeModel.from_dict(code_data) if code_data else None
         if code_model is None or code_model.is_valid is False:
             code = self._generate_code()
             code_model = CodeModel(code)
@@ -727,10 +835,13 @@ class CodeController:
         return self
 
     def __exit__(self, *_) -> None:
-        data = self._codes_data
-        data[str(self.member.id)] = self.code_model
-        with open(self._codes_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False, default=CodeModel.to_dict)
+        # The file is read again, as other members may have
+        # registered while this `with` block was awaiting.
+        path = self._codes_path
+        data = self._load_codes_data(path)
+        data[str(self.member.id)] = self.code_model.to_dict()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
 
 
 @dataclass(slots=True)
@@ -767,16 +878,14 @@ class MemberData:  # pylint: disable=too-many-instance-attributes
     other_account_reason: str | None = field(init=False)
 
     def __post_init__(self) -> None:
-        with open(self._registered_users_path, "r", encoding="utf-8") as f:
-            data: dict[str, dict[str, Any]] = json.load(f)
+        data = _REGISTERED_USERS.get(self._registered_users_path)
         member_data = data.get(str(self.member.id), {})
         self.index = member_data.get("StudentID", "")
         self.first_name = member_data.get("FirstName", "")
         self.last_name = member_data.get("LastName", "")
-        with open(self._student_indexes_path, "r", encoding="utf-8") as f:
-            self.is_student = self.index in f.read().splitlines()
+        self.is_student = self._is_student()
         self.non_student_reason = member_data.get("Non-student reason")
-        self.other_accounts = self._get_other_accounts(data)
+        self.other_accounts = self._get_other_accounts()
         self.other_account_reason = member_data.get("Another account reason")
 
     def __hash__(self) -> int:
@@ -787,6 +896,8 @@ class MemberData:  # pylint: disable=too-many-instance-attributes
         """Creates a new instance of :class:`.MemberData` from registration."""
         self = cls(member)
         self.index = index
+        self.is_student = self._is_student()
+        self.other_accounts = self._get_other_accounts()
         return self
 
     def to_embed(self) -> Embed:
@@ -823,33 +934,25 @@ class MemberData:  # pylint: disable=too-many-instance-attributes
 
     @property
     def _student_indexes_path(self) -> Path:
-        path = Path("data/registration/student_indexes.txt")
-        if not path.exists():
-            path.touch()
-            Console.warn(f"File {path} has been created.")
-        return path
+        return _ensure_file_exists(Path("data/registration/student_indexes.txt"), "")
 
     @property
     def _registered_users_path(self) -> Path:
-        path = Path("data/registration/registered_users.json")
-        if not path.exists():
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(r"{}")
-            Console.warn(f"File {path} has been created.")
-        return path
+        return _ensure_file_exists(
+            Path("data/registration/registered_users.json"), r"{}"
+        )
 
     def _is_student(self) -> bool:
-        with open(self._student_indexes_path, "r", encoding="utf-8") as f:
-            return self.index in f.read().splitlines()
+        return self.index in _STUDENT_INDEXES.get(self._student_indexes_path)
 
-    def _get_other_accounts(self, data: dict[str, dict[str, Any]]) -> list[Member]:
+    def _get_other_accounts(self) -> list[Member]:
+        member_ids = _get_member_ids_by_index(self._registered_users_path)
         return [
             member
-            for k, v in data.items()
+            for member_id in member_ids.get(self.index, ())
             if (
-                v.get("StudentID") == self.index
-                and int(k) != self.member.id
-                and (member := self.member.guild.get_member(int(k))) is not None
+                member_id != self.member.id
+                and (member := self.member.guild.get_member(member_id)) is not None
             )
         ]
 
@@ -934,6 +1037,7 @@ class CodeModal(Modal):
         "_code_model",
         "_member_data",
         "_destination_address",
+        "_reason_inputs",
     )
 
     _bot: SGGWBot
@@ -941,6 +1045,7 @@ class CodeModal(Modal):
     _code_model: CodeModel
     _member_data: MemberData
     _destination_address: str
+    _reason_inputs: dict[str, TextInput]
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -957,13 +1062,15 @@ class CodeModal(Modal):
         self._code_model = code_model
         self._destination_address = destination_address
 
-        self.add_item(self._code_input)
-
+        self._reason_inputs = {}
         if not self._member_data.is_student:
-            self.add_item(self._non_student_info)
-
+            self._reason_inputs["Non-student reason"] = self._non_student_info
         if self._member_data.other_accounts:
-            self.add_item(self._other_account_info)
+            self._reason_inputs["Another account reason"] = self._other_account_info
+
+        self.add_item(self._code_input)
+        for reason_input in self._reason_inputs.values():
+            self.add_item(reason_input)
 
     @property
     def _code_input(self) -> TextInput:
@@ -1014,17 +1121,6 @@ class CodeModal(Modal):
         code_input = self.children[0]
         assert isinstance(code_input, TextInput)
 
-        data = {}
-        if not self._member_data.is_student:
-            data["Non-student reason"] = self.children[1]
-            if self._member_data.other_accounts:
-                data["Another account reason"] = self.children[2]
-        elif self._member_data.other_accounts:
-            data["Another account reason"] = self.children[1]
-
-        for data_value in data.values():
-            assert isinstance(data_value, TextInput)
-
         if code_input.value != self._code_model.code:
             await interaction.response.send_message(
                 "**Wpisany kod jest niepoprawny!**",
@@ -1074,8 +1170,7 @@ class CodeModal(Modal):
                 1, name="Nick", value=MemberUtils.display_name(member)
             )
 
-        v: TextInput
-        for k, v in data.items():
+        for k, v in self._reason_inputs.items():
             embed.add_field(name=k, value=v.value, inline=False)
 
         await bot_channel.send(embed=embed)
@@ -1100,22 +1195,15 @@ class RegisterController:
 
     @property
     def _registered_users_path(self) -> Path:
-        path = Path("data/registration/registered_users.json")
-        if not path.exists():
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(r"{}")
-            Console.warn(f"File {path} has been created.")
-        return path
+        return _ensure_file_exists(
+            Path("data/registration/registered_users.json"), r"{}"
+        )
 
     def _load_data(self) -> None:
-        path = self._registered_users_path
-        with open(path, "r", encoding="utf-8") as f:
-            self._data = json.load(f)
+        self._data = _REGISTERED_USERS.get(self._registered_users_path)
 
     def _save_data(self) -> None:
-        path = self._registered_users_path
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, ensure_ascii=True, indent=4)
+        _save_registered_users(self._registered_users_path, self._data)
 
     def __enter__(self) -> RegisterController:
         self._load_data()
@@ -1141,18 +1229,14 @@ class RegisterController:
         member_id = str(member.id)
         data = self._data
 
-        try:
-            data[member_id]["StudentID"] = member_data.index
-        except KeyError:
-            data[member_id] = {"StudentID": member_data.index}
+        data.setdefault(member_id, {})["StudentID"] = member_data.index
 
         if not member_data.is_student:
             data[member_id]["Non-student reason"] = info.pop(0).value
         if member_data.other_accounts:
             data[member_id]["Another account reason"] = info.pop(0).value
 
-        self._data = data
-        self._save_data()
+        # The data is saved once, when leaving the `with` block.
         await member.add_roles(self._verified_role)
 
 
@@ -1166,52 +1250,43 @@ class MailController:
     _destination_domain: str = field(init=False)
 
     def __post_init__(self) -> None:
-        self._load_destination_domain()
+        self._destination_domain = _get_mail_env_value("DESTINATION_MAIL_DOMAIN")
 
     @property
     def destination_address(self) -> str:
         """Returns the destination address."""
         return f"s{self._index}@{self._destination_domain}"
 
-    def _load_destination_domain(self) -> None:
-        env_name = "DESTINATION_MAIL_DOMAIN"
-        domain = os.environ.get(env_name)
-        if domain is None:
-            raise RegistrationError(f"{env_name} in .env is empty")
-        self._destination_domain = domain
-
     @property
     def _mail_text(self) -> MIMEText:
-        path = Path("data/registration/email.html")
-        with open(path, "r", encoding="utf-8") as f:
-            text = f.read()
+        template = _MAIL_TEMPLATE.get(Path("data/registration/email.html"))
 
-        text = (
-            text.replace(
-                "{{USER_DISPLAY_NAME}}", f"{MemberUtils.display_name(self._member)}"
-            )
-            .replace("{{REGISTRATION_CODE}}", self._code_model.code)
-            .replace("{{DISCORD_NAME}}", self._member.guild.name)
-            .replace("{{CODE_EXPIRATION}}", self._code_model.expire)
-        )
-
-        server_icon = self._member.guild.icon
-        user_avatar = self._member.avatar
+        replacements = {
+            "USER_DISPLAY_NAME": MemberUtils.display_name(self._member),
+            "REGISTRATION_CODE": self._code_model.code,
+            "DISCORD_NAME": self._member.guild.name,
+            "CODE_EXPIRATION": self._code_model.expire,
+        }
 
-        if user_avatar:
-            text = text.replace("{{USER_AVATAR}}", user_avatar.url)
+        if user_avatar := self._member.avatar:
+            replacements["USER_AVATAR"] = user_avatar.url
 
-        if server_icon:
-            text = text.replace("{{DISCORD_LOGO}}", server_icon.url)
+        if server_icon := self._member.guild.icon:
+            replacements["DISCORD_LOGO"] = server_icon.url
 
+        text = _MAIL_PLACEHOLDER.sub(
+            lambda match: replacements.get(match.group(1), match.group(0)),
+            template,
+        )
         return MIMEText(text, "html", "utf-8")
 
-    def _generate_message(self) -> MIMEMultipart:
-        message = MIMEMultipart()
-        message["Subject"] = "Rejestracja Discord"
-        message["From"] = "noreply"
-        message["To"] = f"s{self._index}@{self._destination_domain}"
-        message.attach(self._mail_text)
+    def _generate_message(self) -> MIMEText:
+        # The mail has only the HTML body, so it is sent as a single part
+        # instead of being wrapped in a multipart container.
+        message = self._mail_text
+        message["Subject"] = _MAIL_SUBJECT
+        message["From"] = _MAIL_SENDER
+        message["To"] = self.destination_address
         return message
 
     async def send_mail(self) -> None:
@@ -1224,23 +1299,13 @@ class MailController:
         RegistrationError
             Sending email failed.
         """
+        username = _get_mail_env_value("MAIL_ADDRESS")
+        password = _get_mail_env_value("MAIL_PASSWORD")
 
-        username = os.environ.get("MAIL_ADDRESS")
-        password = os.environ.get("MAIL_PASSWORD")
-
-        if username is None or password is None:
-            raise RegistrationError("MAIL_ADRESS or MAIL_PASSWORD in .env is empty")
-
-        async with aiosmtplib.SMTP(
-            hostname="smtp.gmail.com", port=465, use_tls=True
-        ) as smtp:
-            try:
-                await smtp.login(username, password)
-                message = self._generate_message()
-                await smtp.send_message(message)
-                self._code_model.add_mail_sent_time(self._index)
-            except (ValueError, aiosmtplib.errors.SMTPException) as e:
-                raise RegistrationError(*e.args) from e
+        message = self._generate_message()
+        async with _SMTP_LOCK:
+            await self._send_with_smtp_client(message, username, password)
+            self._code_model.add_mail_sent_time(self._index)
 
         Console.specific(
             f"Email with code {self._code_model.code} has been sent to "
@@ -1251,6 +1316,45 @@ class MailController:
             bold_text=True,
         )
 
+    @classmethod
+    async def _send_with_smtp_client(
+        cls, message: MIMEText, username: str, password: str
+    ) -> None:
+        """Sends the message with the shared SMTP client.
+
+        The client is connected and logged in only if it is not already.
+        It is dropped after any error, so the next call reconnects.
+        If the server has closed a reused connection, the message
+        is sent once more with a new one.
+
+        Raises
+        ------
+        RegistrationError
+            Sending email failed.
+        """
+        global _SMTP_CLIENT  # pylint: disable=global-statement
+
+        reused = _SMTP_CLIENT is not None and _SMTP_CLIENT.is_connected
+        try:
+            if _SMTP_CLIENT is None or not reused:
+                _SMTP_CLIENT = aiosmtplib.SMTP(
+                    hostname="smtp.gmail.com", port=465, use_tls=True
+                )
+                await _SMTP_CLIENT.connect()
+                await _SMTP_CLIENT.login(username, password)
+            await _SMTP_CLIENT.send_message(message)
+        except aiosmtplib.errors.SMTPServerDisconnected as e:
+            _SMTP_CLIENT = None
+            if reused:
+                await cls._send_with_smtp_client(message, username, password)
+                return
+            raise RegistrationError(*e.args) from e
+        except (ValueError, aiosmtplib.errors.SMTPException) as e:
+            if _SMTP_CLIENT is not None:
+                _SMTP_CLIENT.close()
+                _SMTP_CLIENT = None
+            raise RegistrationError(*e.args) from e
+
 
 def setup(bot: SGGWBot) -> None:
     """Loads the RegistrationCog cog."""
@@ -25,7 +25,7 @@ import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (TYPE_CHECKING, Any, Awaitable, Callable, Concatenate,
-                    ParamSpec)
+                    KeysView, ParamSpec)
 
 import nextcord
 from nextcord.application_command import SlashOption
@@ -178,8 +178,9 @@ class RoleAssignment(commands.Cog):
         identifier: :class:`str`
             The identifier of the role assignment.
         """
-        msg = await interaction.original_message()
-        await msg.edit(content=None, file=self._controllers[identifier].embed_json)
+        await interaction.edit_original_message(
+            content=None, file=self._controllers[identifier].embed_json
+        )
 
     @_role_assignment.subcommand(
         name="set_json",
@@ -266,20 +267,15 @@ class RoleAssignment(commands.Cog):
         else:
             return
 
+        # Only the message ID is needed to remove the reaction,
+        # so the message is not fetched.
+        message = channel.get_partial_message(payload.message_id)
+
+        async def remove_reaction():
+            await message.remove_reaction(emoji, member)
+
         try:
-            message = await channel.fetch_message(payload.message_id)
-            if emoji.is_custom_emoji():
-                reaction = nextcord.utils.get(message.reactions, emoji=emoji)
-            else:
-                reaction = nextcord.utils.get(message.reactions, emoji=emoji.name)
-
-            async def remove_reaction():
-                await message.remove_reaction(emoji, member)
-
-            if (
-                reaction is None
-                or self._bot.user not in await reaction.users().flatten()
-            ):
+            if str(emoji) not in controller.model.emojis:
                 return await remove_reaction()
 
             async def change_role():
@@ -330,7 +326,9 @@ class RoleAssignment(commands.Cog):
 
     async def _load_controllers(self) -> dict[str, RoleAssignmentController]:
         controllers = {}
-        for path in RoleAssignmentModel.get_settings_directory().iterdir():
+        # Only JSON files are controllers, so leftovers like
+        # '*.json.tmp' from an interrupted save are skipped.
+        for path in RoleAssignmentModel.get_settings_directory().glob("*.json"):
             identifier = path.stem
             model = RoleAssignmentModel(identifier)
             embed_model = RoleAssignmentEmbedModel(model, self._bot)
@@ -389,9 +387,11 @@ class RoleAssignmentModel(Model):
     The role_assignment model is a singleton.
     """
 
-    __slots__ = ("_roles", "_identifier")
+    __slots__ = ("_roles", "_roles_by_emoji", "_role_ids", "_identifier")
 
     _roles: list[ServerRole]
+    _roles_by_emoji: dict[str, ServerRole]
+    _role_ids: frozenset[int]
     _identifier: str
 
     def __init__(self, identifier: str) -> None:
@@ -430,6 +430,9 @@ class RoleAssignmentModel(Model):
             role = self._load_role(role_name)
             self.roles.append(role)
 
+        self._roles_by_emoji = {role.emoji: role for role in self._roles}
+        self._role_ids = frozenset(role.role_id for role in self._roles)
+
     def _load_role(self, key: str) -> ServerRole:
         role_data = self._roles_data.get(key)
         if role_data is None:
@@ -446,6 +449,21 @@ class RoleAssignmentModel(Model):
         """Role list."""
         return self._roles
 
+    @property
+    def emojis(self) -> KeysView[str]:
+        """Emojis of all roles."""
+        return self._roles_by_emoji.keys()
+
+    @property
+    def roles_by_emoji(self) -> dict[str, ServerRole]:
+        """Roles keyed by their emojis."""
+        return self._roles_by_emoji
+
+    @property
+    def role_ids(self) -> frozenset[int]:
+        """IDs of all roles."""
+        return self._role_ids
+
     @property
     def identifier(self) -> str:
         """Identifier of the role assignment."""
@@ -547,37 +565,29 @@ class RoleAssignmentController(ControllerWithEmbed):
             The role corresponding to the emoji does not exist.
         """
 
-        role_to_add: Role | None = None
-        roles_to_remove: list[Role] = []
-        reaction = str(emoji)
-        only_reset = False
-
-        for server_role in self.model.roles:
-            role = member.guild.get_role(server_role.role_id)
-            if role is None:
-                if server_role.role_id == 0 and reaction == server_role.emoji:
-                    only_reset = True
-                continue  # pragma: no cover
-
-            if reaction == server_role.emoji:
-                role_to_add = role
-                for member_role in member.roles:
-                    if member_role.id in server_role.additional_role_ids_to_remove:
-                        roles_to_remove.append(member_role)
-            elif role in member.roles:
-                roles_to_remove.append(role)
-
-        if role_to_add is None and not only_reset:
+        server_role = self.model.roles_by_emoji.get(str(emoji))
+        if server_role is None:
             raise AttributeError(f"Role with '{emoji}' not exists")
 
-        async def add_role():
-            if role_to_add is not None:
-                await member.add_roles(role_to_add)
+        role_to_add = member.guild.get_role(server_role.role_id)
+        role_ids_to_remove = self.model.role_ids - {server_role.role_id}
+        if role_to_add is not None:
+            role_ids_to_remove |= set(server_role.additional_role_ids_to_remove)
+        elif server_role.role_id != 0:
+            raise AttributeError(f"Role with '{emoji}' not exists")
 
-        await asyncio.gather(
-            member.remove_roles(*roles_to_remove),
-            add_role(),
-        )
+        default_role = member.guild.default_role
+        current_roles = [role for role in member.roles if role != default_role]
+        new_roles = [
+            role for role in current_roles if role.id not in role_ids_to_remove
+        ]
+        if role_to_add is not None and role_to_add not in new_roles:
+            new_roles.append(role_to_add)
+
+        # All roles are set in a single request, instead of
+        # separate requests for removing and adding them.
+        if new_roles != current_roles:
+            await member.edit(roles=new_roles)
 
         return role_to_add
 
@@ -106,8 +106,8 @@ class SGGWBot(commands.Bot):
                 "Complete it and start the bot again.",
             )
 
-        with open(path, "r", encoding="utf-8") as f:
-            data: dict = json.load(f)
+        with open(path, "rb") as f:
+            data: dict = json.loads(f.read())
 
         guild_id = data.get("GUILD_ID")
         if not isinstance(guild_id, int):
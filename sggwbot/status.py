@@ -80,9 +80,9 @@ class StatusCog(commands.Cog):
     def _get_data_from_file(self) -> tuple[ActivityType, str]:
         try:
             with open(self._STATUS_PATH, "r", encoding="utf-8") as f:
-                lines = list(map(str.strip, f.readlines()))
-            return (ActivityType[lines[0]], lines[1].strip())
-        except (OSError, nextcord.DiscordException, KeyError) as e:
+                lines = f.read().splitlines()
+            return (ActivityType[lines[0].strip()], lines[1].strip())
+        except (OSError, nextcord.DiscordException, KeyError, IndexError) as e:
             Console.warn(
                 "Status could not be loaded. The default status has been set.",
                 exception=e,
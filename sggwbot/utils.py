@@ -8,6 +8,7 @@ import datetime as dt
 import functools
 import os
 import re
+import time
 import traceback
 from abc import ABC
 from dataclasses import KW_ONLY, dataclass
@@ -18,6 +19,7 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    ClassVar,
     Concatenate,
     Generic,
     Hashable,
@@ -43,6 +45,9 @@ if TYPE_CHECKING:
     _P = ParamSpec("_P")
     _FUNC = Callable[Concatenate[Any, Interaction, _P], Awaitable[Any]]
 
+# Matches positions before each uppercase letter except the first one.
+_CAMEL_CASE_BOUNDARY = re.compile("(?<!^)(?=[A-Z])")
+
 
 class InteractionUtils(ABC):
     """A class containing static methods that can be used to decorate commands.
@@ -140,8 +145,7 @@ class InteractionUtils(ABC):
             @nextcord.slash_command()
             @with_info(before='msg_before', after='msg_after')
             async def foo(self, interaction: Interaction) -> None:
-                msg = await interaction.original_message()
-                await msg.edit(content='msg_foo')
+                await interaction.edit_original_message(content='msg_foo')
 
         After invoking the command below,
         if the user sent 0 as 'b' parameter,
@@ -209,8 +213,7 @@ class InteractionUtils(ABC):
                         await interaction.response.send_message(err_msg, ephemeral=True)
                     else:
                         try:
-                            msg = await interaction.original_message()
-                            await msg.edit(content=err_msg)
+                            await interaction.edit_original_message(content=err_msg)
                         except nextcord.errors.NotFound:
                             await interaction.send(err_msg, ephemeral=True)
 
@@ -244,9 +247,9 @@ class InteractionUtils(ABC):
                                 after.format(**kwargs), ephemeral=True
                             )
                         else:
-                            msg = await interaction.original_message()
-                            if not msg.content.startswith("**[ERROR]**"):
-                                await msg.edit(content=after.format(**kwargs))
+                            await interaction.edit_original_message(
+                                content=after.format(**kwargs)
+                            )
 
                     return result
 
@@ -289,7 +292,12 @@ class PathUtils(ABC):  # pylint: disable=too-few-public-methods
         when saving a class to a file.
         """
 
-        ret = re.sub("(?<!^)(?=[A-Z])", "_", obj.__class__.__name__).lower()
+        return PathUtils._convert_classname(obj.__class__.__name__)
+
+    @staticmethod
+    @functools.cache
+    def _convert_classname(classname: str) -> str:
+        ret = _CAMEL_CASE_BOUNDARY.sub("_", classname).lower()
         if ret.endswith("_model"):
             return "_".join(ret.split("_")[:-1])
         return ret
@@ -371,8 +379,11 @@ class ProjectUtils(ABC):  # pylint: disable=too-few-public-methods
     This class should not be instantiated.
     """
 
-    @staticmethod
-    def lines_of_code() -> int:
+    _LINES_OF_CODE_TTL: ClassVar[float] = 60.0
+    _lines_of_code_cache: ClassVar[tuple[float, int] | None] = None
+
+    @classmethod
+    def lines_of_code(cls) -> int:
         """Returns the number of lines of code in the project.
 
         Returns
@@ -386,8 +397,24 @@ class ProjectUtils(ABC):  # pylint: disable=too-few-public-methods
         by counting lines of code in all Python files
         in the project directory except for the ones
         that are ignored by the '.gitignore' file.
+
+        The result is cached for :attr:`_LINES_OF_CODE_TTL` seconds,
+        as the project files rarely change while the bot is running.
         """
 
+        now = time.monotonic()
+        if (
+            cls._lines_of_code_cache is not None
+            and now - cls._lines_of_code_cache[0] < cls._LINES_OF_CODE_TTL
+        ):
+            return cls._lines_of_code_cache[1]
+
+        lines_of_code = cls._count_lines_of_code()
+        cls._lines_of_code_cache = (now, lines_of_code)
+        return lines_of_code
+
+    @staticmethod
+    def _count_lines_of_code() -> int:
         try:
             with open(".gitignore", "r", encoding="utf-8") as f:
                 ignored = f.read().split("\n")
@@ -398,33 +425,102 @@ class ProjectUtils(ABC):  # pylint: disable=too-few-public-methods
                 exception=e,
             )
 
+        # Directory entries in '.gitignore' (e.g. '.venv/') must match
+        # the bare names returned by the directory scan.
+        ignored = [item.strip("/") for item in ignored]
         ignored.extend([".git", ".gitignore"])
         result = [0]
 
         def count(path: Path, result: list[int]) -> None:
-            for item in os.listdir(path):
-                if item in ignored:
-                    continue
-                current_path = path / item
-                if current_path.is_dir():
-                    count(current_path, result)
-                if item.endswith(".py"):
-                    try:
-                        with open(current_path, "r", encoding="utf-8") as f:
-                            lines = f.readlines()
-                    except OSError as e:
-                        Console.warn(
-                            f"Cannot open {current_path} to count lines of code.",
-                            exception=e,
-                        )
-                    else:
-                        result[0] += len(lines)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name in ignored:
+                        continue
+                    if entry.is_dir():
+                        count(Path(entry.path), result)
+                    if entry.name.endswith(".py"):
+                        try:
+                            with open(entry.path, "r", encoding="utf-8") as f:
+                                lines = f.readlines()
+                        except OSError as e:
+                            Console.warn(
+                                f"Cannot open {entry.path} to count lines of code.",
+                                exception=e,
+                            )
+                        else:
+                            result[0] += len(lines)
 
         root_dir = Path(os.path.abspath(os.curdir))
         count(root_dir, result)
         return result[0]
 
 
+_FileCacheT = TypeVar("_FileCacheT")
+
+
+class FileCache(Generic[_FileCacheT]):
+    """A cache of parsed files, keyed by path.
+
+    A file is parsed again only if its (mtime, size) has changed
+    since the last read, which detects edits made outside the bot.
+    A file may keep the same (mtime, size) after a same-length change,
+    so files written by the bot must be passed to :meth:`set`
+    or :meth:`invalidate` after writing.
+
+    Attributes
+    ----------
+    parse: Callable[[:class:`Path`], _FileCacheT]
+        The function that reads and parses the file.
+
+    Examples
+    -------- ::
+
+        _TEMPLATES = FileCache(lambda path: path.read_text(encoding="utf-8"))
+        template = _TEMPLATES.get(Path("template.html"))
+    """
+
+    __slots__ = ("parse", "_entries")
+
+    parse: Callable[[Path], _FileCacheT]
+    _entries: dict[Path, tuple[tuple[int, int], _FileCacheT]]
+
+    def __init__(self, parse: Callable[[Path], _FileCacheT]) -> None:
+        self.parse = parse
+        self._entries = {}
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: Path) -> _FileCacheT:
+        """Returns the parsed file, parsing it only if it has changed.
+
+        The returned value is shared, so it must not be modified in place.
+
+        Raises
+        ------
+        OSError
+            The file cannot be read.
+        """
+        signature = self._signature(path)
+        cached = self._entries.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        value = self.parse(path)
+        self._entries[path] = (signature, value)
+        return value
+
+    def set(self, path: Path, value: _FileCacheT) -> None:
+        """Stores the value of the file that has just been written."""
+        self._entries[path] = (self._signature(path), value)
+
+    def invalidate(self, path: Path) -> None:
+        """Removes the file from the cache, so it is parsed on the next read."""
+        self._entries.pop(path, None)
+
+
 _MatcherT = TypeVar("_MatcherT")
 _MatcherResultT = TypeVar("_MatcherResultT")
 
@@ -524,6 +620,8 @@ class Matcher(Generic[_MatcherT]):
         self,
         value: str,
         key: Callable[[_MatcherT], str] = str,
+        *,
+        min_ratio: float = 0.0,
     ) -> list[Matcher.Result[_MatcherT]]:
         """Finds all matches to the given value.
 
@@ -536,24 +634,48 @@ class Matcher(Generic[_MatcherT]):
             The value to find.
         key: Callable[[:class:`_MatcherT`], :class:`str`]
             A function to convert the items to strings. Defaults to `str`.
+        min_ratio: :class:`float`
+            The minimum ratio of the match. Items with a lower ratio
+            are not included in the result. Defaults to `0.0`.
 
         Returns
         -------
         list[:class:`Finder.Result`[:class:`_MatcherT`]]
             A list of all matches to the given value.
+
+        Notes
+        -----
+        The cheap upper bounds of the ratio are checked first,
+        so items that cannot reach `min_ratio` are rejected
+        without computing the full ratio.
         """
 
-        return [
-            Matcher.Result(
-                item,
-                SequenceMatcher(
-                    lambda i: i.isspace(),
-                    value.lower() if self.ignore_case else value,
-                    key(item).lower() if self.ignore_case else value,
-                ).ratio(),
-            )
-            for item in self.items
-        ]
+        if self.ignore_case:
+            value = value.lower()
+
+        # SequenceMatcher caches detailed information about
+        # the second sequence, so the value is set only once.
+        matcher = SequenceMatcher(lambda i: i.isspace(), autojunk=False)
+        matcher.set_seq2(value)
+
+        results = []
+        for item in self.items:
+            item_value = key(item).lower() if self.ignore_case else key(item)
+
+            if item_value == value:
+                ratio = 1.0
+            else:
+                matcher.set_seq1(item_value)
+                if (
+                    matcher.real_quick_ratio() < min_ratio
+                    or matcher.quick_ratio() < min_ratio
+                ):
+                    continue
+                ratio = matcher.ratio()
+
+            if ratio >= min_ratio:
+                results.append(Matcher.Result(item, ratio))
+        return results
 
 
 _KeyT = TypeVar("_KeyT", bound=Hashable)
@@ -113,6 +113,10 @@ class MemberMock:
         for role in roles:
             self.roles.append(role)
 
+    async def edit(self, *, roles=None, **_) -> None:
+        if roles is not None:
+            self.roles = list(roles)
+
     def __repr__(self) -> str:
         return f"<MemberMock name='{self.name}' nick='{self.nick}' id={self.id}>"
 
@@ -123,3 +127,30 @@ class PartialEmojiMock:
 
     def __str__(self) -> str:
         return self.emoji
+
+
+class SMTPMock:
+    is_connected: bool
+    calls: list[str]
+    send_error: Exception | None
+
+    def __init__(self, **_) -> None:
+        self.is_connected = False
+        self.calls = []
+        self.send_error = None
+
+    async def connect(self) -> None:
+        self.calls.append("connect")
+        self.is_connected = True
+
+    async def login(self, username: str, password: str) -> None:
+        self.calls.append("login")
+
+    async def send_message(self, message) -> None:
+        self.calls.append("send_message")
+        if self.send_error is not None:
+            raise self.send_error
+
+    def close(self) -> None:
+        self.calls.append("close")
+        self.is_connected = False
@@ -93,8 +93,10 @@ def test_load_not_existsing_group(model: RoleAssignmentModel) -> None:
 
 
 def test_load_groups(model: RoleAssignmentModel) -> None:
+    assert model.emojis == {"1️⃣", "*️⃣"}
     _add_group_to_json("group_1", 345, "desc3", "3️⃣")
     model.reload_settings()
+    assert model.emojis == {"1️⃣", "*️⃣", "3️⃣"}
 
 
 def test_groups_data(model: RoleAssignmentModel) -> None:
@@ -146,3 +148,22 @@ async def test_change_group_role(ctrl: RoleAssignmentController) -> None:
 
 def test_embed_reaction(embed_model: RoleAssignmentEmbedModel) -> None:
     assert embed_model.reactions == ["1️⃣", "*️⃣"]
+
+
+@pytest.mark.asyncio
+async def test_load_controllers_skips_non_json_files(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    data = {"roles": {"guest": {"role_id": 345, "description": "Guest", "emoji": "*️⃣"}}}
+    (tmp_path / "groups.json").write_text(json.dumps(data), encoding="utf-8")
+    # Left behind by a save interrupted before the file was replaced.
+    (tmp_path / "groups.json.tmp").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(
+        RoleAssignmentModel, "get_settings_directory", staticmethod(lambda: tmp_path)
+    )
+
+    class Cog:
+        _bot = BotMock(GuildMock())
+
+    controllers = await RoleAssignment._load_controllers(Cog())  # type: ignore
+    assert list(controllers) == ["groups"]
@@ -444,6 +444,19 @@ def test_get_event_with_index_greater_than_list_size(
         model.get_event_at_index(2)
 
 
+def test_get_event_with_non_numeric_index(
+    model: CalendarModel,
+    date_now: datetime.date,
+    time_now: datetime.time,
+) -> None:
+    event = Event("", date_now, time_now, "", "")
+    model.add_event_to_json(event)
+    with pytest.raises(IndexError):
+        model.get_event_with_index("abc")
+    with pytest.raises(IndexError):
+        model.get_event_with_index("_abc")
+
+
 def test_get_event_from_non_empty_calendar(
     model: CalendarModel,
     date_now: datetime.date,
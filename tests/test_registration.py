@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Generator
 
+import aiosmtplib
 import pytest
 from nextcord.embeds import Embed
 from pytest import MonkeyPatch
 
+import sggwbot.registration
+from sggwbot.errors import RegistrationError
 from sggwbot.registration import (
     CodeController,
     CodeModel,
+    MailController,
     MailLog,
     MemberData,
     RegistrationModel,
+    _get_member_ids_by_index,
+    _save_registered_users,
 )
 
 from .mocks import *
@@ -134,12 +142,23 @@ def test_member_data_to_embed(member1: MemberMock) -> None:
     assert embed.to_dict() == embed2.to_dict()
 
 
+@pytest.fixture
+def registered_users_path(monkeypatch: MonkeyPatch) -> Generator[Path, None, None]:
+    monkeypatch.setattr(RegistrationModel, "_registered_users_path", TEST_JSON_PATH)
+    yield TEST_JSON_PATH
+    TEST_JSON_PATH.unlink(missing_ok=True)
+
+
 def test_matching_members(
     monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    registered_users_path: Path,
     member1: MemberMock,
     member2: MemberMock,
 ) -> None:
-    monkeypatch.setattr(RegistrationModel, "_registered_users_path", TEST_JSON_PATH)
+    settings_path = tmp_path / "registration_settings.json"
+    settings_path.write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(RegistrationModel, "_settings_path", settings_path)
 
     member1_data = MemberDataMock(
         member1,
@@ -173,6 +192,9 @@ def test_matching_members(
         self.other_accounts = []
 
     monkeypatch.setattr(MemberData, "__init__", member_data_init)
+    with open(registered_users_path, "w", encoding="utf-8") as f:
+        json.dump(member_data, f)
+
     guild = GuildMock()
     registration_model = RegistrationModel(BotMock(guild))  # type: ignore
 
@@ -187,10 +209,165 @@ def test_matching_members(
     assert result == [member2_data]
     result = registration_model.find_matching_members("987654")
     assert result == []
+    result = registration_model.find_matching_members(str(member1.id))
+    assert result == [member1_data]
+    result = registration_model.find_matching_members("²")
+    assert result == []
     result = registration_model.find_matching_members("asdfasdf")
     assert result == []
 
 
+def test_find_members_by_index_without_registered_users_file(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sggwbot.registration, "_EXISTING_FILES", set())
+    Path("data/registration").mkdir(parents=True)
+    Path("logs").mkdir()  # Console logs the creation of the file.
+    settings_path = tmp_path / "registration_settings.json"
+    settings_path.write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(RegistrationModel, "_settings_path", settings_path)
+
+    registration_model = RegistrationModel(BotMock(GuildMock()))  # type: ignore
+    assert registration_model.find_matching_members("123456") == []
+    assert Path("data/registration/registered_users.json").read_text() == "{}"
+
+
+def test_member_ids_by_index_after_save_with_same_signature(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    real_replace = sggwbot.registration.os.replace
+
+    def replace_keeping_mtime(src: Path, dst: Path) -> None:
+        # Emulates a filesystem with a coarse mtime resolution.
+        mtime = dst.stat().st_mtime_ns if dst.exists() else None
+        real_replace(src, dst)
+        if mtime is not None:
+            os.utime(dst, ns=(mtime, mtime))
+
+    monkeypatch.setattr(sggwbot.registration.os, "replace", replace_keeping_mtime)
+
+    path = tmp_path / "registered_users.json"
+    _save_registered_users(path, {"1": {"StudentID": "123456"}})
+    assert _get_member_ids_by_index(path) == {"123456": [1]}
+
+    # The file has the same size and mtime after changing the index.
+    _save_registered_users(path, {"1": {"StudentID": "654321"}})
+    assert _get_member_ids_by_index(path) == {"654321": [1]}
+
+
+def test_registered_users_cache_after_failed_save(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    path = tmp_path / "registered_users.json"
+    _save_registered_users(path, {"1": {"StudentID": "123456"}})
+
+    def replace_failing(src: Path, dst: Path) -> None:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(sggwbot.registration.os, "replace", replace_failing)
+
+    data = sggwbot.registration._REGISTERED_USERS.get(path)
+    data["2"] = {"StudentID": "654321"}
+    with pytest.raises(OSError):
+        _save_registered_users(path, data)
+
+    assert sggwbot.registration._REGISTERED_USERS.get(path) == {
+        "1": {"StudentID": "123456"}
+    }
+    assert _get_member_ids_by_index(path) == {"123456": [1]}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_member_data_from_registration(
+    monkeypatch: MonkeyPatch, tmp_path: Path, member1: MemberMock, member2: MemberMock
+) -> None:
+    student_indexes_path = tmp_path / "student_indexes.txt"
+    student_indexes_path.write_text("123456\n123457\n", encoding="utf-8")
+    registered_users_path = tmp_path / "registered_users.json"
+    registered_users_path.write_text(
+        json.dumps({str(member2.id): {"StudentID": "123457"}}), encoding="utf-8"
+    )
+    monkeypatch.setattr(MemberData, "_student_indexes_path", student_indexes_path)
+    monkeypatch.setattr(MemberData, "_registered_users_path", registered_users_path)
+
+    guild = GuildMock()
+    member1.guild = guild
+    member2.guild = guild
+
+    # The data of an unregistered member has no index yet.
+    assert MemberData(member1).is_student is False  # type: ignore
+
+    member_data = MemberData.from_registration(member1, "123456")  # type: ignore
+    assert member_data.is_student is True
+    assert member_data.other_accounts == []
+
+    member_data = MemberData.from_registration(member1, "123457")  # type: ignore
+    assert member_data.is_student is True
+    assert member_data.other_accounts == [member2]
+
+    member_data = MemberData.from_registration(member1, "999999")  # type: ignore
+    assert member_data.is_student is False
+    assert member_data.other_accounts == []
+
+
+@pytest.fixture
+def smtp_clients(monkeypatch: MonkeyPatch) -> list[SMTPMock]:
+    """The SMTP clients created by the mail controller, in order."""
+    clients: list[SMTPMock] = []
+
+    def create_client(**kwargs) -> SMTPMock:
+        clients.append(SMTPMock(**kwargs))
+        return clients[-1]
+
+    monkeypatch.setattr(sggwbot.registration.aiosmtplib, "SMTP", create_client)
+    monkeypatch.setattr(sggwbot.registration, "_SMTP_CLIENT", None)
+    return clients
+
+
+@pytest.mark.asyncio
+async def test_smtp_client_is_reused(smtp_clients: list[SMTPMock]) -> None:
+    await MailController._send_with_smtp_client(None, "user", "pass")  # type: ignore
+    await MailController._send_with_smtp_client(None, "user", "pass")  # type: ignore
+
+    assert len(smtp_clients) == 1
+    assert smtp_clients[0].calls == [
+        "connect",
+        "login",
+        "send_message",
+        "send_message",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_smtp_client_reconnects_after_disconnect(
+    smtp_clients: list[SMTPMock],
+) -> None:
+    await MailController._send_with_smtp_client(None, "user", "pass")  # type: ignore
+    smtp_clients[0].send_error = aiosmtplib.errors.SMTPServerDisconnected("closed")
+
+    await MailController._send_with_smtp_client(None, "user", "pass")  # type: ignore
+
+    assert len(smtp_clients) == 2
+    assert smtp_clients[1].calls == ["connect", "login", "send_message"]
+    assert sggwbot.registration._SMTP_CLIENT is smtp_clients[1]
+
+
+@pytest.mark.asyncio
+async def test_smtp_client_is_dropped_after_error(
+    smtp_clients: list[SMTPMock],
+) -> None:
+    await MailController._send_with_smtp_client(None, "user", "pass")  # type: ignore
+    smtp_clients[0].send_error = aiosmtplib.errors.SMTPException("refused")
+
+    with pytest.raises(RegistrationError):
+        await MailController._send_with_smtp_client(None, "user", "pass")  # type: ignore
+
+    assert len(smtp_clients) == 1
+    assert smtp_clients[0].calls[-1] == "close"
+    assert sggwbot.registration._SMTP_CLIENT is None
+
+
 def test_mail_log() -> None:
     now = dt.datetime.now()
     mail_log = MailLog("123456", [now])